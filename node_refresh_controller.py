@@ -6,13 +6,16 @@ Zero-downtime node cycling with safe pod eviction
 
 import os
 import time
+import random
+import asyncio
 import logging
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from croniter import croniter
 
-from kubernetes import client, config, watch
-from kubernetes.client.rest import ApiException
+from kubernetes_asyncio import client, config, watch
+from kubernetes_asyncio.client.rest import ApiException
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,60 +24,360 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class RequeueAfter:
+    """Reconcile result asking for the resource to be reconciled again later"""
+    
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+
 class NodeRefreshOperator:
     """Kubernetes Operator for zero-downtime node cycling"""
     
     def __init__(self):
-        """Initialize the operator with Kubernetes clients"""
+        """Initialize the operator state (clients are created in setup())"""
+        self.api_client = None
+        self.metadata_client = None
+        self.core_v1 = None
+        self.core_v1_metadata = None
+        self.apps_v1 = None
+        self.policy_v1 = None
+        self.custom_api = None
+        
+        self.group = "noderefresh.io"
+        self.version = "v1"
+        self.plural = "noderefreshes"
+        
+        self.retry_delays = [30, 60, 120, 300]  # Retry delays in seconds
+        
+        # Last NodeRefresh resourceVersion seen, so the watch can resume
+        self._last_rv: Optional[str] = None
+        
+        # Watch lifetime range in seconds; jittered so reconnects don't align
+        self.watch_timeout_range = (1800, 3600)
+        
+        self.list_page_size = 500  # Items per LIST page
+        self.request_timeout = 30  # Seconds per LIST request
+        self.connection_pool_maxsize = 100  # Concurrent API connections
+        
+        # Work queue of (wake_at, name); workers only pick up due entries
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._queue_wakeup = asyncio.Event()
+        self._scheduled: Dict[str, float] = {}  # Earliest wake_at per resource
+        self._latest: Dict[str, Dict] = {}  # Newest object seen per resource
+        self._active: set = set()  # Resources being reconciled right now
+        self._dirty: set = set()  # Resources that changed while active
+        self._workers: List[asyncio.Task] = []
+        self.max_concurrent_reconciles = 4
+        
+        # In-memory progress for phases that span several reconciles
+        self._drains: Dict[str, Dict] = {}
+        self.max_eviction_attempts = 10  # Drain passes before a pod is given up
+        self.replacement_timeout = 90  # seconds from eviction to healthy replacements
+        self._retry_at: Dict[str, float] = {}
+        self._refreshed_by_cr: Dict[str, set] = {}  # Mirrors nodesRefreshed
+        
+        # ISO timestamp reused within a reconcile tick, per resource, as
+        # (monotonic time it was taken, formatted timestamp)
+        self._now_iso: Dict[str, tuple] = {}
+        self.timestamp_max_age = 1  # seconds
+        
+        # Parsed cron expressions keyed by schedule string
+        self._cron_cache: Dict[str, Any] = {}
+        
+        # Short-lived node listings keyed by label selector
+        self._node_cache: Dict[str, tuple] = {}
+        self.node_cache_ttl = 5  # seconds
+        
+        # Serialized targetNodeLabels per CR, with the generation they came from
+        self._selector_cache: Dict[str, tuple] = {}
+        
+        # Cluster-wide PDBs indexed by namespace, shared across drain batches
+        self._pdb_snapshot: Optional[tuple] = None
+        self._pdb_fetch: Optional[asyncio.Task] = None  # In-flight PDB LIST
+        self.pdb_cache_ttl = 10  # seconds
+        
+        # Pod phases maintained by the pod informer, keyed by pod UID
+        self._pod_phases: Dict[str, str] = {}
+        self._pod_phase_counts: Counter = Counter()
+        self._pods_synced = asyncio.Event()
+        self._pod_informer: Optional[asyncio.Task] = None
+        
+        # Status updates waiting to be written, coalesced per resource
+        self._pending_status: Dict[str, Dict] = {}
+        self._status_objects: Dict[str, Dict] = {}
+        self._status_locks: Dict[str, asyncio.Lock] = {}  # One PATCH in flight per resource
+        self._status_flush_task: Optional[asyncio.Task] = None
+        self._conditions: Dict[str, deque] = {}  # Last 10 conditions per resource
+        self.status_flush_interval = 0.2  # seconds
+    
+    async def setup(self):
+        """Load cluster configuration and create Kubernetes clients"""
         try:
             config.load_incluster_config()
             logger.info("Loaded in-cluster configuration")
         except config.ConfigException:
-            config.load_kube_config()
+            await config.load_kube_config()
             logger.info("Loaded kubeconfig configuration")
         
-        self.core_v1 = client.CoreV1Api()
-        self.apps_v1 = client.AppsV1Api()
-        self.policy_v1 = client.PolicyV1Api()
-        self.custom_api = client.CustomObjectsApi()
+        cfg = client.Configuration.get_default_copy()
+        cfg.connection_pool_maxsize = self.connection_pool_maxsize
         
-        self.group = "noderefresh.io"
-        self.version = "v1"
-        self.plural = "noderefreshes"
+        # One ApiClient, and so one connection pool, shared by all API groups;
+        # the metadata client below keeps a second pool of its own
+        self.api_client = client.ApiClient(cfg)
+        self.core_v1 = client.CoreV1Api(self.api_client)
+        self.apps_v1 = client.AppsV1Api(self.api_client)
+        self.policy_v1 = client.PolicyV1Api(self.api_client)
+        self.custom_api = client.CustomObjectsApi(self.api_client)
         
-        self.retry_delays = [30, 60, 120, 300]  # Retry delays in seconds
+        # Ask for gzip on every request, watches included; aiohttp
+        # decompresses responses transparently
+        self.api_client.set_default_header('Accept-Encoding', 'gzip')
+        
+        # Metadata-only client: LISTs come back as PartialObjectMetadataList,
+        # which still carries labels and owner references
+        self.metadata_client = client.ApiClient(cfg)
+        self.metadata_client.set_default_header(
+            'Accept',
+            'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,'
+            'application/json'
+        )
+        self.metadata_client.set_default_header('Accept-Encoding', 'gzip')
+        self.core_v1_metadata = client.CoreV1Api(self.metadata_client)
     
-    def run(self):
+    async def close(self):
+        """Close both ApiClients and their connection pools"""
+        for api_client in (self.api_client, self.metadata_client):
+            if api_client is not None:
+                await api_client.close()
+    
+    async def run(self):
         """Main operator loop - watch for NodeRefresh resources"""
         logger.info("Starting Node Refresh Operator...")
         
-        w = watch.Watch()
+        self._pod_informer = asyncio.create_task(self._watch_pods())
+        self._status_flush_task = asyncio.create_task(self._status_flusher())
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.max_concurrent_reconciles)
+        ]
         
         while True:
             try:
-                for event in w.stream(
-                    self.custom_api.list_cluster_custom_object,
-                    group=self.group,
-                    version=self.version,
-                    plural=self.plural,
-                    timeout_seconds=300
-                ):
-                    event_type = event['type']
-                    obj = event['object']
-                    
-                    logger.info(f"Event: {event_type} for {obj['metadata']['name']}")
-                    
-                    if event_type in ['ADDED', 'MODIFIED']:
-                        self.reconcile(obj)
+                # A fresh list also drops resources deleted while unwatched
+                if self._last_rv is None:
+                    await self._relist()
+                
+                timeout_seconds = self._watch_timeout()
+                async with watch.Watch() as w:
+                    async for event in w.stream(
+                        self.custom_api.list_cluster_custom_object,
+                        group=self.group,
+                        version=self.version,
+                        plural=self.plural,
+                        resource_version=self._last_rv,
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=timeout_seconds,
+                        _request_timeout=timeout_seconds + 60
+                    ):
+                        event_type = event['type']
+                        obj = event['object']
+                        self._last_rv = obj['metadata'].get('resourceVersion')
+                        
+                        # Bookmarks only carry a resourceVersion to resume from
+                        if event_type == 'BOOKMARK':
+                            continue
+                        
+                        logger.info(f"Event: {event_type} for {obj['metadata']['name']}")
+                        
+                        if event_type in ['ADDED', 'MODIFIED']:
+                            self._latest[obj['metadata']['name']] = obj
+                            self._enqueue(obj['metadata']['name'])
+                        elif event_type == 'DELETED':
+                            self._forget(obj['metadata']['name'])
                     
             except ApiException as e:
+                if e.status == 410:  # Gone - resource version too old
+                    logger.info("Watch expired, re-listing NodeRefresh resources")
+                    self._last_rv = None
+                    continue
                 logger.error(f"API Exception: {e}")
-                time.sleep(10)
+                await asyncio.sleep(10)
             except Exception as e:
                 logger.error(f"Unexpected error in watch loop: {e}")
-                time.sleep(10)
+                await asyncio.sleep(10)
+    
+    async def _relist(self):
+        """List every NodeRefresh, queue it, and forget ones no longer present"""
+        items = []
+        _continue = None
+        while True:
+            resp = await self.custom_api.list_cluster_custom_object(
+                group=self.group,
+                version=self.version,
+                plural=self.plural,
+                limit=self.list_page_size,
+                _continue=_continue,
+                _request_timeout=self.request_timeout
+            )
+            items.extend(resp.get('items', []))
+            _continue = resp['metadata'].get('continue')
+            if not _continue:
+                break
+        
+        listed = {obj['metadata']['name'] for obj in items}
+        for name in set(self._latest) - listed:
+            logger.info(f"NodeRefresh {name} was deleted while unwatched")
+            self._forget(name)
+        
+        for obj in items:
+            self._latest[obj['metadata']['name']] = obj
+            self._enqueue(obj['metadata']['name'])
+        
+        self._last_rv = resp['metadata'].get('resourceVersion')
+        logger.info(f"Listed {len(items)} NodeRefresh resources")
+    
+    def _watch_timeout(self) -> int:
+        """Pick a server-side watch timeout from the jittered range"""
+        return random.randint(*self.watch_timeout_range)
+    
+    def _enqueue(self, name: str, delay: float = 0):
+        """Schedule a resource to be reconciled after delay seconds"""
+        wake_at = time.monotonic() + delay
+        
+        # An earlier (or equal) entry already covers this request
+        scheduled = self._scheduled.get(name)
+        if scheduled is not None and scheduled <= wake_at:
+            return
+        
+        self._scheduled[name] = wake_at
+        self._queue.put_nowait((wake_at, name))
+        self._queue_wakeup.set()
+    
+    def _forget(self, name: str):
+        """Drop all queued work and in-memory state for a deleted resource"""
+        self._latest.pop(name, None)
+        self._scheduled.pop(name, None)
+        self._dirty.discard(name)
+        self._drains.pop(name, None)
+        self._retry_at.pop(name, None)
+        self._refreshed_by_cr.pop(name, None)
+        self._conditions.pop(name, None)
+        self._selector_cache.pop(name, None)
+        self._pending_status.pop(name, None)
+        self._status_objects.pop(name, None)
+        self._status_locks.pop(name, None)
+        self._now_iso.pop(name, None)
     
-    def reconcile(self, obj: Dict):
+    async def _worker(self):
+        """Reconcile resources from the work queue as they become due"""
+        while True:
+            entry = await self._queue.get()
+            wake_at, name = entry
+            
+            # Superseded by an earlier entry, or the resource was deleted
+            if self._scheduled.get(name) != wake_at:
+                continue
+            
+            delay = wake_at - time.monotonic()
+            if delay > 0:
+                # Not due yet; put it back and sleep until it is due or
+                # something new is queued
+                self._queue.put_nowait(entry)
+                self._queue_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._queue_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            del self._scheduled[name]
+            
+            if name in self._active:
+                # Another worker has it; reconcile again once that finishes
+                self._dirty.add(name)
+                continue
+            
+            obj = self._latest.get(name)
+            if obj is None:
+                continue
+            
+            self._active.add(name)
+            try:
+                result = await self.reconcile(obj)
+                if isinstance(result, RequeueAfter):
+                    self._enqueue(name, result.seconds)
+            except Exception as e:
+                logger.error(f"Unexpected error in reconcile worker for {name}: {e}")
+            finally:
+                self._active.discard(name)
+                if name in self._dirty:
+                    self._dirty.discard(name)
+                    self._enqueue(name)
+    
+    async def _watch_pods(self):
+        """Keep pod phase counts current from a cluster-wide pod list-watch"""
+        resource_version = None
+        
+        while True:
+            try:
+                if resource_version is None:
+                    pods = await self._paged_list(
+                        self.core_v1.list_pod_for_all_namespaces
+                    )
+                    self._pod_phases = {
+                        p.metadata.uid: p.status.phase for p in pods.items
+                    }
+                    self._pod_phase_counts = Counter(self._pod_phases.values())
+                    resource_version = pods.metadata.resource_version
+                    self._pods_synced.set()
+                    logger.info(f"Pod informer synced {len(self._pod_phases)} pods")
+                
+                # Consume events as plain dicts; building V1Pod models for
+                # every event is the bulk of the decode cost on this stream
+                timeout_seconds = self._watch_timeout()
+                async with watch.Watch(return_type='object') as w:
+                    async for event in w.stream(
+                        self.core_v1.list_pod_for_all_namespaces,
+                        resource_version=resource_version,
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=timeout_seconds,
+                        _request_timeout=timeout_seconds + 60
+                    ):
+                        resource_version = w.resource_version
+                        if event['type'] != 'BOOKMARK':
+                            self._apply_pod_event(event['type'], event['object'])
+                
+            except ApiException as e:
+                # Health checks fall back to a LIST until the next sync
+                self._pods_synced.clear()
+                resource_version = None
+                if e.status == 410:  # Gone - resource version too old
+                    logger.info("Pod watch expired, re-listing pods")
+                    continue
+                logger.error(f"API Exception in pod informer: {e}")
+                await asyncio.sleep(10)
+            except Exception as e:
+                self._pods_synced.clear()
+                resource_version = None
+                logger.error(f"Unexpected error in pod informer: {e}")
+                await asyncio.sleep(10)
+    
+    def _apply_pod_event(self, event_type: str, pod: Dict):
+        """Apply a single raw pod watch event to the phase counts"""
+        uid = pod['metadata']['uid']
+        phase = (pod.get('status') or {}).get('phase')
+        
+        previous = self._pod_phases.pop(uid, None)
+        if previous is not None:
+            self._pod_phase_counts[previous] -= 1
+        
+        if event_type != 'DELETED':
+            self._pod_phases[uid] = phase
+            self._pod_phase_counts[phase] += 1
+    
+    async def reconcile(self, obj: Dict) -> Optional[RequeueAfter]:
         """Main reconciliation loop for NodeRefresh resource"""
         name = obj['metadata']['name']
         spec = obj['spec']
@@ -85,34 +388,38 @@ class NodeRefreshOperator:
         try:
             # Check if scheduled refresh is due
             if spec.get('refreshSchedule'):
-                if not self._is_refresh_due(obj):
+                if not await self._is_refresh_due(obj):
                     logger.info(f"Refresh not due for {name}")
-                    return
+                    next_run = self._get_cron(spec['refreshSchedule']).get_next(datetime)
+                    return RequeueAfter((next_run - datetime.utcnow()).total_seconds())
             
             # Get current phase
             current_phase = status.get('phase', 'Idle')
             
             if current_phase == 'Idle':
-                self._start_refresh(obj)
+                return await self._start_refresh(obj)
             elif current_phase == 'Provisioning':
-                self._handle_provisioning(obj)
+                return await self._handle_provisioning(obj)
             elif current_phase == 'Draining':
-                self._handle_draining(obj)
+                return await self._handle_draining(obj)
             elif current_phase == 'Validating':
-                self._handle_validation(obj)
+                return await self._handle_validation(obj)
             elif current_phase == 'Completed':
-                self._handle_completion(obj)
+                return await self._handle_completion(obj)
             elif current_phase == 'Failed':
-                self._handle_failure(obj)
+                return await self._handle_failure(obj)
                 
         except Exception as e:
             logger.error(f"Error reconciling {name}: {e}")
-            self._update_status(obj, {
+            self._drains.pop(name, None)
+            await self._update_status(obj, {
                 'phase': 'Failed',
                 'message': f"Reconciliation error: {str(e)}"
             })
+        finally:
+            self._now_iso.pop(name, None)
     
-    def _is_refresh_due(self, obj: Dict) -> bool:
+    async def _is_refresh_due(self, obj: Dict) -> bool:
         """Check if scheduled refresh is due"""
         spec = obj['spec']
         status = obj.get('status', {})
@@ -123,11 +430,11 @@ class NodeRefreshOperator:
         if not schedule:
             return True
         
-        cron = croniter(schedule, datetime.utcnow())
+        cron = self._get_cron(schedule)
         next_run = cron.get_next(datetime)
         
         # Update next refresh time
-        self._update_status(obj, {
+        await self._update_status(obj, {
             'nextRefreshTime': next_run.isoformat() + 'Z'
         })
         
@@ -137,19 +444,31 @@ class NodeRefreshOperator:
         last_refresh_dt = datetime.fromisoformat(last_refresh.replace('Z', '+00:00'))
         return datetime.utcnow() >= next_run
     
-    def _start_refresh(self, obj: Dict):
+    def _get_cron(self, schedule: str):
+        """Return a cached croniter for the schedule, reset to the current time"""
+        cron = self._cron_cache.get(schedule)
+        if cron is None:
+            cron = croniter(schedule, datetime.utcnow())
+            self._cron_cache[schedule] = cron
+        else:
+            cron.set_current(datetime.utcnow(), force=True)
+        return cron
+    
+    async def _start_refresh(self, obj: Dict):
         """Start the node refresh process"""
         name = obj['metadata']['name']
         spec = obj['spec']
         
         logger.info(f"Starting node refresh for {name}")
+        self._refreshed_by_cr.pop(name, None)
+        self._drains.pop(name, None)
         
         # Get target nodes
-        target_nodes = self._get_target_nodes(spec['targetNodeLabels'])
+        target_nodes = await self._get_target_nodes(spec['targetNodeLabels'], obj)
         
         if not target_nodes:
             logger.warning(f"No nodes found matching labels for {name}")
-            self._update_status(obj, {
+            await self._update_status(obj, {
                 'phase': 'Completed',
                 'message': 'No target nodes found',
                 'totalNodes': 0
@@ -159,28 +478,62 @@ class NodeRefreshOperator:
         logger.info(f"Found {len(target_nodes)} nodes to refresh")
         
         # Start with first node
-        self._update_status(obj, {
+        await self._update_status(obj, {
             'phase': 'Provisioning',
             'currentNode': target_nodes[0].metadata.name,
             'totalNodes': len(target_nodes),
+            'targetNodeNames': [n.metadata.name for n in target_nodes],
             'nodesRefreshed': [],
             'podsMovedSuccessfully': 0,
             'podsMovesFailed': 0,
             'message': f'Provisioning new node for {target_nodes[0].metadata.name}'
         })
     
-    def _get_target_nodes(self, label_selector: Dict[str, str]) -> List:
+    async def _get_target_nodes(self, label_selector: Dict[str, str],
+                                obj: Optional[Dict] = None) -> List:
         """Get nodes matching the label selector"""
-        selector = ','.join([f"{k}={v}" for k, v in label_selector.items()])
+        selector = self._get_selector(label_selector, obj)
         
         try:
-            nodes = self.core_v1.list_node(label_selector=selector)
-            return nodes.items
+            return await self._list_nodes(selector)
         except ApiException as e:
             logger.error(f"Error listing nodes: {e}")
             return []
     
-    def _handle_provisioning(self, obj: Dict):
+    def _get_selector(self, label_selector: Dict[str, str],
+                      obj: Optional[Dict] = None) -> str:
+        """Serialize a label selector, cached per CR until its spec changes"""
+        # metadata.generation only moves on spec changes, so comparing it
+        # is enough to know targetNodeLabels is unchanged
+        name = obj['metadata']['name'] if obj else None
+        generation = obj['metadata'].get('generation') if obj else None
+        cached = self._selector_cache.get(name) if generation is not None else None
+        if cached and cached[0] == generation:
+            return cached[1]
+        
+        selector = ','.join([f"{k}={v}" for k, v in label_selector.items()])
+        if generation is not None:
+            self._selector_cache[name] = (generation, selector)
+        return selector
+    
+    async def _list_nodes(self, selector: str = '') -> List:
+        """List nodes for a label selector, reusing a recent result if fresh"""
+        now = time.monotonic()
+        cached = self._node_cache.get(selector)
+        if cached and now - cached[0] < self.node_cache_ttl:
+            return cached[1]
+        
+        # Drop expired listings so selectors no CR uses any more don't linger
+        for key in [k for k, v in self._node_cache.items()
+                    if now - v[0] >= self.node_cache_ttl]:
+            del self._node_cache[key]
+        
+        kwargs = {'label_selector': selector} if selector else {}
+        nodes = await self._paged_list(self.core_v1.list_node, **kwargs)
+        self._node_cache[selector] = (time.monotonic(), nodes.items)
+        return nodes.items
+    
+    async def _handle_provisioning(self, obj: Dict) -> Optional[RequeueAfter]:
         """Handle node provisioning phase"""
         name = obj['metadata']['name']
         spec = obj['spec']
@@ -194,25 +547,25 @@ class NodeRefreshOperator:
         # For this example, we'll simulate checking for available nodes
         
         # Get all ready nodes
-        all_nodes = self.core_v1.list_node()
-        ready_nodes = [n for n in all_nodes.items if self._is_node_ready(n)]
+        all_nodes = await self._list_nodes()
+        ready_nodes = [n for n in all_nodes if self._is_node_ready(n)]
         
         # Check if we have capacity (at least one extra node)
-        target_nodes = self._get_target_nodes(spec['targetNodeLabels'])
+        target_nodes = await self._get_target_nodes(spec['targetNodeLabels'], obj)
         
         if len(ready_nodes) > len(target_nodes):
             logger.info("Sufficient capacity available, proceeding to drain")
-            self._update_status(obj, {
+            await self._update_status(obj, {
                 'phase': 'Draining',
                 'message': f'Draining node {current_node}'
             })
         else:
             logger.info("Waiting for additional capacity...")
             # In production, would trigger node scale-up here
-            time.sleep(30)
+            return RequeueAfter(30)
     
-    def _handle_draining(self, obj: Dict):
-        """Handle node draining phase"""
+    async def _handle_draining(self, obj: Dict) -> Optional[RequeueAfter]:
+        """Handle node draining phase, one batch of pods per pass"""
         name = obj['metadata']['name']
         spec = obj['spec']
         status = obj.get('status', {})
@@ -221,53 +574,140 @@ class NodeRefreshOperator:
         logger.info(f"Draining node: {current_node}")
         
         # Check minimum health threshold across cluster
-        if not self._check_cluster_health(spec.get('minHealthThreshold', 80)):
+        if not await self._check_cluster_health(spec.get('minHealthThreshold', 80)):
             logger.warning("Cluster health below threshold, pausing drain")
-            self._update_status(obj, {
+            await self._update_status(obj, {
                 'message': 'Paused: Cluster health below threshold'
             })
-            time.sleep(60)
-            return
+            return RequeueAfter(60)
         
-        # Get pods on the node
-        pods = self._get_pods_on_node(current_node)
-        max_concurrent = spec.get('maxPodsToMoveAtOnce', 5)
+        drain = self._drains.get(name)
+        if drain is None or drain['node'] != current_node:
+            drain = {
+                'node': current_node,
+                'pending': None,  # UIDs on the node when the drain started
+                'done': set(),  # UIDs of pods evicted or given up on
+                'attempts': {},  # Failed eviction attempts per pod UID
+                'batch': [],  # Pods evicted on the previous pass
+                'batch_deadline': 0,  # When the batch counts as failed
+                'success': 0,
+                'failed': 0
+            }
+            self._drains[name] = drain
         
-        logger.info(f"Found {len(pods)} pods on node {current_node}")
+        # Check if pods evicted on the previous pass are healthy on new nodes;
+        # poll instead of waiting so the worker is free for other resources
+        if drain['batch']:
+            if not await self._verify_pods_healthy(drain['batch']):
+                if time.monotonic() < drain['batch_deadline']:
+                    return RequeueAfter(10)
+                logger.error("Pods not healthy after eviction")
+                drain['failed'] += len(drain['batch'])
+            drain['batch'] = []
+        
+        # Only pods from the first listing are drained; replacements that
+        # get scheduled back onto the uncordoned node are left alone
+        node_pods = await self._get_pods_on_node(current_node)
+        if drain['pending'] is None:
+            drain['pending'] = {pod.metadata.uid for pod in node_pods}
         
-        # Evict pods in batches
-        success_count = 0
-        failed_count = 0
+        # Get pods on the node that have not been evicted yet
+        pods = [
+            pod for pod in node_pods
+            if pod.metadata.uid in drain['pending']
+            and pod.metadata.uid not in drain['done']
+        ]
+        max_concurrent = spec.get('maxPodsToMoveAtOnce', 5)
         
-        for i in range(0, len(pods), max_concurrent):
-            batch = pods[i:i + max_concurrent]
+        logger.info(f"Found {len(pods)} pods left to evict on node {current_node}")
+        
+        if pods:
+            # Evict the batch concurrently; pods a PDB holds back wait a pass
+            pdb_by_ns = await self._get_pdb_index()
+            batch = self._select_eviction_batch(
+                drain, pods, max_concurrent, pdb_by_ns
+            )
+            grace_period = spec.get('gracePeriodSeconds', 300)
+            results = await asyncio.gather(
+                *[self._evict_pod(pod, grace_period) for pod in batch],
+                return_exceptions=True
+            )
             
-            for pod in batch:
-                if self._evict_pod(pod, spec.get('gracePeriodSeconds', 300)):
-                    success_count += 1
+            evicted = []
+            for pod, result in zip(batch, results):
+                if result is True:
+                    drain['success'] += 1
+                    drain['done'].add(pod.metadata.uid)
+                    evicted.append(pod)
                 else:
-                    failed_count += 1
+                    if isinstance(result, Exception):
+                        logger.error(
+                            f"Error evicting pod {pod.metadata.namespace}/"
+                            f"{pod.metadata.name}: {result}"
+                        )
+                    self._record_failed_eviction(drain, pod)
             
-            # Wait for pods to be rescheduled
-            time.sleep(30)
+            drain['batch'] = evicted
+            drain['batch_deadline'] = time.monotonic() + self.replacement_timeout
             
-            # Check if pods are healthy on new nodes
-            if not self._verify_pods_healthy(batch):
-                logger.error("Pods not healthy after eviction")
-                failed_count += len(batch)
+            # Wait for pods to be rescheduled before verifying this batch
+            return RequeueAfter(30)
+        
+        del self._drains[name]
         
         # Update status
-        total_success = status.get('podsMovedSuccessfully', 0) + success_count
-        total_failed = status.get('podsMovesFailed', 0) + failed_count
+        total_success = status.get('podsMovedSuccessfully', 0) + drain['success']
+        total_failed = status.get('podsMovesFailed', 0) + drain['failed']
         
-        self._update_status(obj, {
+        await self._update_status(obj, {
             'phase': 'Validating',
             'podsMovedSuccessfully': total_success,
             'podsMovesFailed': total_failed,
             'message': f'Validating pod health after draining {current_node}'
         })
     
-    def _handle_validation(self, obj: Dict):
+    def _select_eviction_batch(self, drain: Dict, pods: List, limit: int,
+                               pdb_by_ns: Optional[Dict[str, List]]) -> List:
+        """Pick up to limit pods without exceeding any PDB's disruption budget"""
+        budgets: Dict[tuple, int] = {}
+        batch = []
+        
+        for pod in pods:
+            if len(batch) >= limit:
+                break
+            
+            pdb = self._matching_pdb(pod, pdb_by_ns)
+            if pdb is not None:
+                key = (pdb.metadata.namespace, pdb.metadata.name)
+                allowed = budgets.get(key, pdb.status.disruptions_allowed or 0)
+                if allowed <= 0:
+                    logger.warning(
+                        f"PDB {pdb.metadata.name} prevents eviction of "
+                        f"{pod.metadata.namespace}/{pod.metadata.name}"
+                    )
+                    self._record_failed_eviction(drain, pod)
+                    continue
+                budgets[key] = allowed - 1
+            
+            batch.append(pod)
+        
+        return batch
+    
+    def _record_failed_eviction(self, drain: Dict, pod):
+        """Count a failed eviction; give the pod up once it runs out of attempts"""
+        uid = pod.metadata.uid
+        attempts = drain['attempts'].get(uid, 0) + 1
+        drain['attempts'][uid] = attempts
+        
+        if attempts >= self.max_eviction_attempts:
+            logger.error(
+                f"Giving up on evicting {pod.metadata.namespace}/"
+                f"{pod.metadata.name} after {attempts} attempts"
+            )
+            drain['failed'] += 1
+            drain['done'].add(uid)
+    
+    async def _handle_validation(self, obj: Dict):
         """Validate that pods are healthy after migration"""
         name = obj['metadata']['name']
         spec = obj['spec']
@@ -277,69 +717,85 @@ class NodeRefreshOperator:
         logger.info(f"Validating pod health after draining {current_node}")
         
         # Check overall cluster health
-        if self._check_cluster_health(spec.get('minHealthThreshold', 80)):
+        if await self._check_cluster_health(spec.get('minHealthThreshold', 80)):
             logger.info(f"Validation successful for {current_node}")
             
-            # Mark node as completed
+            # Mark node as completed, using an in-memory set for membership
             nodes_refreshed = status.get('nodesRefreshed', [])
-            nodes_refreshed.append(current_node)
+            refreshed = self._refreshed_by_cr.get(name)
+            if refreshed is None or len(refreshed) != len(nodes_refreshed):
+                refreshed = set(nodes_refreshed)
+                self._refreshed_by_cr[name] = refreshed
+            
+            if current_node not in refreshed:
+                nodes_refreshed.append(current_node)
+                refreshed.add(current_node)
             
             # Check if there are more nodes to refresh
             total_nodes = status.get('totalNodes', 0)
             
             if len(nodes_refreshed) < total_nodes:
-                # Get next node
-                target_nodes = self._get_target_nodes(spec['targetNodeLabels'])
-                remaining_nodes = [n for n in target_nodes 
-                                 if n.metadata.name not in nodes_refreshed]
+                # Get next node from the list recorded when the refresh started
+                target_names = status.get('targetNodeNames')
+                if target_names is None:
+                    target_nodes = await self._get_target_nodes(spec['targetNodeLabels'], obj)
+                    target_names = [n.metadata.name for n in target_nodes]
                 
-                if remaining_nodes:
-                    next_node = remaining_nodes[0].metadata.name
+                # Nodes go in recorded order, so start looking where the
+                # refreshed ones end
+                position = len(nodes_refreshed)
+                candidates = target_names[position:] + target_names[:position]
+                next_node = next(
+                    (n for n in candidates if n not in refreshed), None
+                )
+                
+                if next_node:
                     logger.info(f"Moving to next node: {next_node}")
                     
-                    self._update_status(obj, {
+                    await self._update_status(obj, {
                         'phase': 'Provisioning',
                         'currentNode': next_node,
                         'nodesRefreshed': nodes_refreshed,
                         'message': f'Provisioning for next node: {next_node}'
                     })
                 else:
-                    self._finalize_refresh(obj, nodes_refreshed)
+                    await self._finalize_refresh(obj, nodes_refreshed)
             else:
-                self._finalize_refresh(obj, nodes_refreshed)
+                await self._finalize_refresh(obj, nodes_refreshed)
         else:
             logger.error("Validation failed - cluster health below threshold")
-            self._update_status(obj, {
+            self._drains.pop(name, None)
+            await self._update_status(obj, {
                 'phase': 'Failed',
                 'message': 'Validation failed: Cluster health below threshold'
             })
     
-    def _finalize_refresh(self, obj: Dict, nodes_refreshed: List[str]):
+    async def _finalize_refresh(self, obj: Dict, nodes_refreshed: List[str]):
         """Finalize the refresh process"""
         logger.info("All nodes refreshed successfully")
+        self._refreshed_by_cr.pop(obj['metadata']['name'], None)
         
-        self._update_status(obj, {
+        await self._update_status(obj, {
             'phase': 'Completed',
             'nodesRefreshed': nodes_refreshed,
-            'lastRefreshTime': datetime.utcnow().isoformat() + 'Z',
+            'lastRefreshTime': self._timestamp(obj),
             'message': f'Successfully refreshed {len(nodes_refreshed)} nodes'
         })
         
         # Reset to Idle if scheduled
         if obj['spec'].get('refreshSchedule'):
-            time.sleep(5)
-            self._update_status(obj, {'phase': 'Idle'})
+            await self._update_status(obj, {'phase': 'Idle'})
     
-    def _handle_completion(self, obj: Dict):
+    async def _handle_completion(self, obj: Dict):
         """Handle completion phase"""
         spec = obj['spec']
         
         # If scheduled, move back to Idle
         if spec.get('refreshSchedule'):
             logger.info("Scheduled refresh completed, returning to Idle")
-            self._update_status(obj, {'phase': 'Idle'})
+            await self._update_status(obj, {'phase': 'Idle'})
     
-    def _handle_failure(self, obj: Dict):
+    async def _handle_failure(self, obj: Dict) -> Optional[RequeueAfter]:
         """Handle failure with retry logic"""
         name = obj['metadata']['name']
         status = obj.get('status', {})
@@ -347,39 +803,45 @@ class NodeRefreshOperator:
         retry_count = status.get('retryCount', 0)
         
         if retry_count < len(self.retry_delays):
-            delay = self.retry_delays[retry_count]
-            logger.info(f"Retrying after {delay}s (attempt {retry_count + 1})")
+            if name not in self._retry_at:
+                delay = self.retry_delays[retry_count]
+                logger.info(f"Retrying after {delay}s (attempt {retry_count + 1})")
+                self._retry_at[name] = time.monotonic() + delay
+            
+            remaining = self._retry_at[name] - time.monotonic()
+            if remaining > 0:
+                return RequeueAfter(remaining)
             
-            time.sleep(delay)
+            del self._retry_at[name]
             
-            self._update_status(obj, {
+            await self._update_status(obj, {
                 'phase': 'Idle',
                 'retryCount': retry_count + 1,
                 'message': f'Retrying (attempt {retry_count + 1})'
             })
         else:
             logger.error(f"Max retries exceeded for {name}")
-            self._update_status(obj, {
+            await self._update_status(obj, {
                 'message': 'Failed: Max retries exceeded'
             })
     
-    def _get_pods_on_node(self, node_name: str) -> List:
-        """Get all pods running on a specific node"""
+    async def _get_pods_on_node(self, node_name: str) -> List:
+        """Get metadata for all pods running on a specific node"""
         try:
-            pods = self.core_v1.list_pod_for_all_namespaces(
-                field_selector=f'spec.nodeName={node_name}'
+            # System namespaces are excluded server-side
+            pods = await self._paged_list(
+                self.core_v1_metadata.list_pod_for_all_namespaces,
+                field_selector=(
+                    f'spec.nodeName={node_name},'
+                    'metadata.namespace!=kube-system,'
+                    'metadata.namespace!=kube-public'
+                )
             )
             
-            # Filter out daemonsets and system pods
-            filtered_pods = []
-            for pod in pods.items:
-                # Skip if owned by DaemonSet
-                if self._is_daemonset_pod(pod):
-                    continue
-                # Skip system namespaces (optional)
-                if pod.metadata.namespace in ['kube-system', 'kube-public']:
-                    continue
-                filtered_pods.append(pod)
+            # Filter out daemonsets
+            filtered_pods = [
+                pod for pod in pods.items if not self._is_daemonset_pod(pod)
+            ]
             
             return filtered_pods
         except ApiException as e:
@@ -396,22 +858,14 @@ class NodeRefreshOperator:
                 return True
         return False
     
-    def _evict_pod(self, pod, grace_period: int) -> bool:
-        """Safely evict a pod with PDB respect"""
+    async def _evict_pod(self, pod, grace_period: int) -> bool:
+        """Evict a pod through the Eviction API, which enforces PDBs"""
         namespace = pod.metadata.namespace
         name = pod.metadata.name
         
         logger.info(f"Evicting pod {namespace}/{name}")
         
         try:
-            # Check if PDB exists for this pod
-            if not self._check_pdb_allows_eviction(pod):
-                logger.warning(f"PDB prevents eviction of {namespace}/{name}")
-                time.sleep(30)
-                # Retry check
-                if not self._check_pdb_allows_eviction(pod):
-                    return False
-            
             # Create eviction
             eviction = client.V1Eviction(
                 metadata=client.V1ObjectMeta(
@@ -423,7 +877,7 @@ class NodeRefreshOperator:
                 )
             )
             
-            self.core_v1.create_namespaced_pod_eviction(
+            await self.core_v1.create_namespaced_pod_eviction(
                 name=name,
                 namespace=namespace,
                 body=eviction
@@ -434,90 +888,103 @@ class NodeRefreshOperator:
             
         except ApiException as e:
             if e.status == 429:  # Too Many Requests (PDB violation)
-                logger.warning(f"PDB violation when evicting {namespace}/{name}")
+                logger.warning(
+                    f"PDB violation when evicting {namespace}/{name}, "
+                    f"retrying next pass"
+                )
                 return False
             logger.error(f"Error evicting pod {namespace}/{name}: {e}")
             return False
     
-    def _check_pdb_allows_eviction(self, pod) -> bool:
-        """Check if Pod Disruption Budget allows eviction"""
-        namespace = pod.metadata.namespace
+    async def _get_pdb_index(self) -> Optional[Dict[str, List]]:
+        """Get all PDBs indexed by namespace, shared by concurrent drains"""
+        if self._pdb_snapshot:
+            fetched_at, pdb_by_ns = self._pdb_snapshot
+            if time.monotonic() - fetched_at < self.pdb_cache_ttl:
+                return pdb_by_ns
         
+        # Drains of other CRs that arrive mid-fetch wait on the same LIST
+        if self._pdb_fetch is None or self._pdb_fetch.done():
+            self._pdb_fetch = asyncio.create_task(self._fetch_pdb_index())
+        return await asyncio.shield(self._pdb_fetch)
+    
+    async def _fetch_pdb_index(self) -> Optional[Dict[str, List]]:
+        """List all PDBs cluster-wide and index them by namespace"""
         try:
-            pdbs = self.policy_v1.list_namespaced_pod_disruption_budget(namespace)
-            
-            for pdb in pdbs.items:
-                # Check if PDB selector matches pod labels
-                if self._selector_matches_pod(pdb.spec.selector, pod):
-                    # Check if disruptions are allowed
-                    if pdb.status.disruptions_allowed > 0:
-                        return True
-                    else:
-                        logger.warning(
-                            f"PDB {pdb.metadata.name} prevents disruption"
-                        )
-                        return False
-            
-            # No matching PDB, eviction allowed
-            return True
-            
+            pdbs = await self._paged_list(
+                self.policy_v1.list_pod_disruption_budget_for_all_namespaces
+            )
         except ApiException as e:
             logger.error(f"Error checking PDB: {e}")
-            # Default to allow if we can't check
-            return True
+            return None
+        
+        pdb_by_ns: Dict[str, List] = defaultdict(list)
+        for pdb in pdbs.items:
+            pdb_by_ns[pdb.metadata.namespace].append(pdb)
+        
+        self._pdb_snapshot = (time.monotonic(), pdb_by_ns)
+        return pdb_by_ns
     
-    def _selector_matches_pod(self, selector, pod) -> bool:
-        """Check if label selector matches pod"""
-        if not selector or not selector.match_labels:
-            return False
+    def _matching_pdb(self, pod, pdb_by_ns: Optional[Dict[str, List]]):
+        """Find the Pod Disruption Budget covering a pod, if any"""
+        # Default to allow if we can't check
+        if pdb_by_ns is None:
+            return None
         
         pod_labels = pod.metadata.labels or {}
         
-        for key, value in selector.match_labels.items():
-            if pod_labels.get(key) != value:
-                return False
+        for pdb in pdb_by_ns.get(pod.metadata.namespace, []):
+            # Check if PDB selector matches pod labels
+            if self._selector_matches_pod(pdb.spec.selector, pod_labels):
+                return pdb
         
-        return True
+        # No matching PDB, eviction allowed
+        return None
     
-    def _verify_pods_healthy(self, pods: List) -> bool:
-        """Verify that pods are running and healthy on new nodes"""
+    def _selector_matches_pod(self, selector, pod_labels: Dict[str, str]) -> bool:
+        """Check if label selector matches the pod's labels"""
+        if not selector or not selector.match_labels:
+            return False
+        
+        # Dict items views compare as sets, so this is a C-level subset check
+        return selector.match_labels.items() <= pod_labels.items()
+    
+    async def _verify_pods_healthy(self, pods: List) -> bool:
+        """Check once whether evicted pods have healthy replacements"""
+        # Pods of one ReplicaSet/StatefulSet share a single owner read;
+        # pods without an owner have nothing to wait for
+        owners = {}
         for pod in pods:
-            namespace = pod.metadata.namespace
-            # Get pod owner to find replacement
             owner = self._get_pod_owner(pod)
-            
-            if not owner:
-                continue
-            
-            # Wait for replacement pod to be ready
-            max_wait = 60  # seconds
-            waited = 0
-            
-            while waited < max_wait:
-                try:
-                    if owner['kind'] == 'ReplicaSet':
-                        rs = self.apps_v1.read_namespaced_replica_set(
-                            owner['name'], namespace
-                        )
-                        if rs.status.ready_replicas >= rs.spec.replicas:
-                            break
-                    elif owner['kind'] == 'StatefulSet':
-                        sts = self.apps_v1.read_namespaced_stateful_set(
-                            owner['name'], namespace
-                        )
-                        if sts.status.ready_replicas >= sts.spec.replicas:
-                            break
-                except ApiException:
-                    pass
-                
-                time.sleep(5)
-                waited += 5
-            
-            if waited >= max_wait:
-                logger.error(f"Timeout waiting for pod replacement")
-                return False
+            if owner:
+                key = (owner['kind'], pod.metadata.namespace, owner['name'])
+                owners[key] = owner
+        
+        results = await asyncio.gather(
+            *[self._is_owner_ready(owner, namespace)
+              for (_, namespace, _), owner in owners.items()]
+        )
+        return all(results)
+    
+    async def _is_owner_ready(self, owner: Dict, namespace: str) -> bool:
+        """Check whether the pod's owner reports all replicas ready"""
+        if owner['kind'] == 'ReplicaSet':
+            read_fn = self.apps_v1.read_namespaced_replica_set
+        elif owner['kind'] == 'StatefulSet':
+            read_fn = self.apps_v1.read_namespaced_stateful_set
+        else:
+            logger.error(f"Cannot verify replacement for {owner['kind']} owner")
+            return False
+        
+        try:
+            resource = await read_fn(
+                owner['name'], namespace, _request_timeout=self.request_timeout
+            )
+        except ApiException as e:
+            logger.warning(f"Error reading {owner['kind']} {namespace}/{owner['name']}: {e}")
+            return False
         
-        return True
+        return (resource.status.ready_replicas or 0) >= (resource.spec.replicas or 0)
     
     def _get_pod_owner(self, pod) -> Optional[Dict]:
         """Get the pod's owner reference"""
@@ -530,19 +997,26 @@ class NodeRefreshOperator:
             'name': owner_ref.name
         }
     
-    def _check_cluster_health(self, threshold: int) -> bool:
+    async def _check_cluster_health(self, threshold: int) -> bool:
         """Check overall cluster health percentage"""
         try:
-            # Get all pods
-            all_pods = self.core_v1.list_pod_for_all_namespaces()
+            if self._pods_synced.is_set():
+                # Use the counts maintained by the pod informer
+                total = len(self._pod_phases)
+                running = self._pod_phase_counts['Running']
+            else:
+                # Informer not synced yet, fall back to listing all pods
+                all_pods = await self._paged_list(
+                    self.core_v1.list_pod_for_all_namespaces
+                )
+                
+                total = len(all_pods.items)
+                running = sum(1 for p in all_pods.items 
+                             if p.status.phase == 'Running')
             
-            total = len(all_pods.items)
             if total == 0:
                 return True
             
-            running = sum(1 for p in all_pods.items 
-                         if p.status.phase == 'Running')
-            
             health_pct = (running / total) * 100
             
             logger.info(f"Cluster health: {health_pct:.1f}% ({running}/{total})")
@@ -553,6 +1027,21 @@ class NodeRefreshOperator:
             logger.error(f"Error checking cluster health: {e}")
             return False
     
+    async def _paged_list(self, list_fn, **kwargs):
+        """Call a LIST endpoint page by page and return one merged response"""
+        kwargs.setdefault('limit', self.list_page_size)
+        kwargs.setdefault('_request_timeout', self.request_timeout)
+        
+        resp = await list_fn(**kwargs)
+        items = list(resp.items)
+        
+        while resp.metadata._continue:
+            resp = await list_fn(_continue=resp.metadata._continue, **kwargs)
+            items.extend(resp.items)
+        
+        resp.items = items
+        return resp
+    
     def _is_node_ready(self, node) -> bool:
         """Check if node is in Ready state"""
         if not node.status.conditions:
@@ -564,58 +1053,112 @@ class NodeRefreshOperator:
         
         return False
     
-    def _update_status(self, obj: Dict, status_update: Dict):
-        """Update the status of NodeRefresh resource"""
+    def _timestamp(self, obj: Dict) -> str:
+        """Get an ISO timestamp, reused while it is under timestamp_max_age"""
         name = obj['metadata']['name']
+        cached = self._now_iso.get(name)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.timestamp_max_age:
+            return cached[1]
         
-        try:
-            # Get current status
-            current = self.custom_api.get_cluster_custom_object_status(
-                group=self.group,
-                version=self.version,
-                plural=self.plural,
-                name=name
-            )
-            
-            current_status = current.get('status', {})
-            current_status.update(status_update)
-            
-            # Add condition
-            if 'phase' in status_update:
-                condition = {
-                    'type': status_update['phase'],
-                    'status': 'True',
-                    'lastTransitionTime': datetime.utcnow().isoformat() + 'Z',
-                    'reason': status_update.get('message', ''),
-                    'message': status_update.get('message', '')
-                }
-                
-                conditions = current_status.get('conditions', [])
-                conditions.append(condition)
-                current_status['conditions'] = conditions[-10:]  # Keep last 10
+        # Handlers can await for a minute or more, so restamp when stale
+        now_iso = datetime.utcnow().isoformat() + 'Z'
+        self._now_iso[name] = (now, now_iso)
+        return now_iso
+    
+    async def _update_status(self, obj: Dict, status_update: Dict):
+        """Queue a status update; phase changes are written immediately"""
+        name = obj['metadata']['name']
+        
+        # Last known status; kept current from each PATCH response
+        current_status = obj.get('status') or {}
+        patch_status = dict(status_update)
+        
+        # Add condition
+        if 'phase' in status_update:
+            condition = {
+                'type': status_update['phase'],
+                'status': 'True',
+                'lastTransitionTime': self._timestamp(obj),
+                'reason': status_update.get('message', ''),
+                'message': status_update.get('message', '')
+            }
             
-            # Update status
-            body = {'status': current_status}
+            conditions = self._conditions.get(name)
+            if conditions is None:
+                conditions = deque(current_status.get('conditions', []), maxlen=10)
+                self._conditions[name] = conditions
             
-            self.custom_api.patch_cluster_custom_object_status(
+            conditions.append(condition)  # Keeps the last 10
+            patch_status['conditions'] = conditions
+        
+        self._pending_status.setdefault(name, {}).update(patch_status)
+        self._status_objects[name] = obj
+        
+        if 'phase' in status_update:
+            await self._flush_status(name)
+    
+    async def _status_flusher(self):
+        """Periodically write coalesced status updates"""
+        while True:
+            await asyncio.sleep(self.status_flush_interval)
+            try:
+                await self._flush_pending_status()
+            except Exception as e:
+                logger.error(f"Unexpected error flushing status: {e}")
+    
+    async def _flush_pending_status(self):
+        """Write every queued status update"""
+        for name in list(self._pending_status):
+            await self._flush_status(name)
+    
+    async def _flush_status(self, name: str):
+        """Write the queued status update for one NodeRefresh resource"""
+        # Serialize PATCHes per resource so responses are applied in order
+        lock = self._status_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            await self._write_status(name)
+    
+    async def _write_status(self, name: str):
+        """PATCH the queued status and keep the cached object current"""
+        patch_status = self._pending_status.pop(name, None)
+        obj = self._status_objects.pop(name, None)
+        
+        if not patch_status:
+            return
+        
+        if 'conditions' in patch_status:
+            patch_status['conditions'] = list(patch_status['conditions'])
+        
+        try:
+            # Merge patch only touches the fields we send, so no GET is needed
+            updated = await self.custom_api.patch_cluster_custom_object_status(
                 group=self.group,
                 version=self.version,
                 plural=self.plural,
                 name=name,
-                body=body
+                body={'status': patch_status},
+                _content_type='application/merge-patch+json'
             )
             
-            logger.info(f"Updated status for {name}: {status_update}")
+            if obj is not None:
+                obj['status'] = updated.get('status') or {}
+            
+            logger.info(f"Updated status for {name}: {patch_status}")
             
         except ApiException as e:
             logger.error(f"Error updating status for {name}: {e}")
 
 
-def main():
+async def main():
     """Main entry point"""
     operator = NodeRefreshOperator()
-    operator.run()
+    try:
+        await operator.setup()
+        await operator.run()
+    finally:
+        await operator.close()
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())